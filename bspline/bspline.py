@@ -5,7 +5,7 @@ from __future__ import division
 import numpy as np
 
 from .geometry import Flat
-from .spline import Spline, max_degree, get_bezier_knots
+from .spline import Spline, max_degree, get_bezier_knots, get_coeff_slice, get_rcoeffs, get_basis_weights, deboor
 
 class BSpline(object):
     def __init__(self, control_points, knots=None, geometry=Flat()):
@@ -21,6 +21,14 @@ class BSpline(object):
                                 knots=kns,
                                 geometry=self.geometry)
                          for pts, kns in get_splines_data(self.knots, self.control_points)]
+        # left end of each interval, to find the spline of a given time
+        self._lefts = np.array([s.interval[0] for s in self._splines])
+        # knot differences of each level, stacked over the splines
+        self._level_diffs = [np.array(diffs).T for diffs in zip(*[s._level_diffs for s in self._splines])] # (K, S)
+        # control points with the point index last, so that gathered points have the time last in memory
+        self._points_last = np.ascontiguousarray(np.moveaxis(self.control_points, 0, -1)) # (D, P)
+        # control points with the data dimensions flattened, for the linear combinations of flat geometry
+        self._flat_points = np.reshape(self.control_points, (len(self.control_points), -1)) # (P, D)
 
     def __repr__(self):
         return "<{} splines of degree {}>".format(len(self), self.degree)
@@ -29,19 +37,37 @@ class BSpline(object):
         return len(self._splines)
 
     def __call__(self, t):
+        """
+        Evaluate all the times at once, each time with the control points and knots of its own spline.
+        """
         t=np.asanyarray(t)
-        l=[]
-        a0 =self._splines[0].interval[0]    
+        a0 =self._splines[0].interval[0]
         bn = self._splines[-1].interval[1]
         if (t<a0).any() or (t>bn).any():
             raise ValueError("Outside interval")
-        for s in self:
-            a,b = s.interval
-            ts = t[(t>=a)*(t<b)]
-            l.append(s(ts))
-        ts=t[t==b]
-        l.append(s(ts))
-        return np.squeeze(np.concatenate(l))
+        ts = np.ravel(t)
+        # spline index of each time; the right end belongs to the last spline
+        index = np.searchsorted(self._lefts, ts, side='right') - 1 # (T,)
+        return np.squeeze(self._evaluate(ts, index))
+
+    def _evaluate(self, ts, index):
+        """
+        Evaluate each time of the flat array `ts` with the spline of the given index.
+        """
+        window = np.arange(self.degree+1)[:, np.newaxis] + index # (K, T)
+        offsets = ts - np.take(self.knots, window[:-1]) # (degree, T)
+        level_diffs = [np.take(diffs, index, axis=1) for diffs in self._level_diffs]
+        rcoeffs = get_rcoeffs(offsets, level_diffs)
+        if self.geometry.linear:
+            # the combination is linear: compute the weights of the control points, then combine the flattened points once
+            weights = get_basis_weights(rcoeffs) # (K, T)
+            result = np.einsum('kt,ktd->td', weights, np.take(self._flat_points, window, axis=0)) # (T, D)
+            result = np.reshape(result, np.shape(ts) + np.shape(self.control_points)[1:])
+        else:
+            pts = np.moveaxis(np.take(self._points_last, window, axis=-1), -2, 0) # (K, D, T)
+            coeff_slice = get_coeff_slice(np.ndim(self.control_points[0]))
+            result = np.moveaxis(deboor(self.geometry, pts, rcoeffs, coeff_slice), -1, 0) # (T, D)
+        return result
 
     def __iter__(self):
         for spline in self._splines:
@@ -6,6 +6,9 @@ def exponential(xi):
     return Exp(xi)[0]
 
 class Geometry(object):
+    # whether the geodesic is the affine combination of its end points,
+    # in which case splines are linear combinations of their control points
+    linear = False
 
     def geodesic(self,P1, P2, theta):
         """
@@ -41,6 +44,34 @@ class Geometry(object):
         """ (d exp_P1)^-1_V1 (W2) """
         raise NotImplementedError()
 
+    def exps(self, P1s, V1s):
+        """
+        Riemannian exponential of a stack of points and velocities.
+        Default implementation loops over the points.
+        """
+        return np.array([self.exp(P1, V1) for P1, V1 in zip(P1s, V1s)])
+
+    def logs(self, P1s, P2s):
+        """
+        Riemannian logarithm of two stacks of points.
+        Default implementation loops over the points.
+        """
+        return np.array([self.log(P1, P2) for P1, P2 in zip(P1s, P2s)])
+
+    def dexpinvs(self, P1s, V1s, W2s):
+        """
+        dexpinv of stacks of points, velocities and vectors.
+        Default implementation loops over the points.
+        """
+        return np.array([self.dexpinv(P1, V1, W2) for P1, V1, W2 in zip(P1s, V1s, W2s)])
+
+    def Adexpinvs(self, P1s, V1s, W2s):
+        """
+        Adexpinv of stacks of points, velocities and vectors.
+        Default implementation loops over the points.
+        """
+        return np.array([self.Adexpinv(P1, V1, W2) for P1, V1, W2 in zip(P1s, V1s, W2s)])
+
     @classmethod
     def on_manifold(self, P):
         """
@@ -55,6 +86,13 @@ class Geometry(object):
         """
         return exponential(self.connection(P, V))
 
+    def redexps(self, Ps, Vs):
+        """
+        Reduced exponential of a stack of points and velocities.
+        Default implementation loops over the points.
+        """
+        return np.array([self.redexp(P, V) for P, V in zip(Ps, Vs)])
+
     @classmethod
     def connection(self, P, V):
         """
@@ -69,6 +107,13 @@ class Geometry(object):
         """
         return np.dot(M, P)
 
+    def actions(self, Ms, Ps):
+        """
+        Action of a stack of group elements on a stack of points.
+        Default implementation loops over the points.
+        """
+        return np.array([self.action(M, P) for M, P in zip(Ms, Ps)])
+
     def projection(self, P1):
         """
         Projection onto unique coordinate space.
@@ -3,11 +3,16 @@ import numpy as np
 from . import Geometry
 
 class Flat(Geometry):
+    # subclasses overriding geodesic must reset this
+    linear = True
+
     def geodesic(self,P1, P2, theta):
         """
         The geodesic between two points.
         """
-        return (1-theta)*P1 + theta*P2
+        P = theta*(P2 - P1)
+        P += P1
+        return P
 
     def involution(self, P1, P2):
         """
@@ -56,15 +61,52 @@ class Flat(Geometry):
         mat[-1,-1] = 0.
         return mat
 
+    def redexp(self, P, V):
+        """
+        The connection is nilpotent, so its exponential is I + connection.
+        """
+        mat = self.connection(P, V)
+        mat += np.identity(len(mat))
+        return mat
+
     def action(self, M, P):
         """
         Not the simple matrix multiplication due to how we store the points.
         """
         return np.dot(M[:-1,:-1], P) + M[:-1,-1]
 
+    def redexps(self, Ps, Vs):
+        """
+        Stacked version of redexp.
+        """
+        n = np.shape(Vs)[-1]
+        mats = np.zeros((len(Vs), n+1, n+1))
+        mats[:,:-1,-1] = Vs
+        mats += np.identity(n+1)
+        return mats
+
+    def actions(self, Ms, Ps):
+        """
+        Stacked version of action.
+        """
+        return np.einsum('ijk,ik->ij', Ms[:,:-1,:-1], Ps) + Ms[:,:-1,-1]
+
     def Adexpinv(self, P1, V1, W2):
         """ 
         Symmetric space function (pi_{P1})^{-1} Ad(exp(-V1))(pi W2)
         where pi is the connection.
         """
         return W2
+
+    # the formulae above hold pointwise on stacks of points
+    def exps(self, P1s, V1s):
+        return self.exp(P1s, V1s)
+
+    def logs(self, P1s, P2s):
+        return self.log(P1s, P2s)
+
+    def dexpinvs(self, P1s, V1s, W2s):
+        return self.dexpinv(P1s, V1s, W2s)
+
+    def Adexpinvs(self, P1s, V1s, W2s):
+        return self.Adexpinv(P1s, V1s, W2s)
@@ -46,6 +46,27 @@ class Hyperbolic(Geometry):
         A[:,1:]=-A[:,1:]
         return A
 
+    def h(self, arg):
+        """
+        (cosh(arg)-1)/arg^2
+        """
+        arg = np.asanyarray(arg, dtype=float)
+        hh = np.zeros_like(arg)
+        idx = np.abs(arg) < 6.0e-4
+        hh[idx] = 0.5 + 1.0/24*arg[idx]*arg[idx]
+        hh[~idx] = (np.cosh(arg[~idx])-1)*arg[~idx]**(-2)
+        return hh
+
+    def redexp(self, P, V):
+        """
+        Closed form exponential of the connection A, which satisfies A^3 = arg^2 A,
+        where arg^2 = tr(A^2)/2 is the squared Minkowski norm of V.
+        """
+        A = self.connection(P, V)
+        A2 = np.dot(A, A)
+        arg = np.sqrt(max(np.trace(A2)/2, 0.))
+        return np.identity(len(A)) + sinhc(arg)*A + self.h(arg)*A2
+
     def random_direction(self, size):
         pp = np.random.randn(size)
         p = np.insert(pp, 0, np.sqrt(1+np.linalg.norm(pp)**2))
@@ -1,5 +1,5 @@
 import numpy as np
-from . import Sphere
+from . import Geometry, Sphere
 from . import  sinc
 
 class Projective(Sphere):
@@ -35,3 +35,9 @@ class Projective(Sphere):
         Projection onto unique coordinate space.
         """
         return 1j*np.einsum('...i,...j->...ij', P1, P1.conj())
+
+    # the horizontal projections above are computed one point at a time,
+    # so the stacked methods loop over the points
+    exps = Geometry.exps
+    logs = Geometry.logs
+    dexpinvs = Geometry.dexpinvs
@@ -41,14 +41,14 @@ class Sphere(Geometry):
         """
         Riemannian exponential
         """
-        angle = np.linalg.norm(V1)
+        angle = np.linalg.norm(V1, axis=-1, keepdims=True)
         return np.cos(angle)*P1+sinc(angle)*V1
 
     def log(self, P1, P2):
         """
         Riemannian logarithm
         """
-        angle = np.arccos(np.clip(np.inner(P1.conj(), P2).real, -1,1))
+        angle = np.arccos(np.clip(np.sum(P1.conj()*P2, axis=-1, keepdims=True).real, -1,1))
         return (P2-np.cos(angle)*P1)/sinc(angle) #Warning: non-stable.
 
     def g(self, angle):
@@ -65,8 +65,8 @@ class Sphere(Geometry):
         """
         (d exp_P1)^-1_V1 (W2)
         """
-        angle = np.linalg.norm(V1)
-        s = np.inner(P1.conj(),W2).real #
+        angle = np.linalg.norm(V1, axis=-1, keepdims=True)
+        s = np.sum(P1.conj()*W2, axis=-1, keepdims=True).real #
         return (W2-s*P1)/sinc(angle)+s*self.g(angle)*V1
 
 
@@ -75,6 +75,37 @@ class Sphere(Geometry):
         cross = V.reshape(-1,1)*P
         return cross - cross.T
 
+    def redexp(self, P, V):
+        """
+        Rodrigues formula for the exponential of the connection,
+        which is a rotation of angle sqrt(|P|^2|V|^2 - <P,V>^2) in the plane spanned by P and V.
+        """
+        A = self.connection(P, V)
+        if np.iscomplexobj(A):
+            return super(Sphere, self).redexp(P, V)
+        angle = np.sqrt(max(np.inner(P, P)*np.inner(V, V) - np.inner(P, V)**2, 0.))
+        return np.identity(len(A)) + sinc(angle)*A - self.h(angle)*np.dot(A, A)
+
+    def redexps(self, Ps, Vs):
+        """
+        Stacked version of redexp.
+        """
+        if np.iscomplexobj(Ps) or np.iscomplexobj(Vs):
+            return super(Sphere, self).redexps(Ps, Vs)
+        cross = Vs[:,:,np.newaxis]*Ps[:,np.newaxis,:]
+        A = cross - cross.transpose(0,2,1)
+        PP = np.sum(Ps*Ps, axis=-1)
+        VV = np.sum(Vs*Vs, axis=-1)
+        PV = np.sum(Ps*Vs, axis=-1)
+        angle = np.sqrt(np.clip(PP*VV - PV**2, 0., None))[:, np.newaxis, np.newaxis]
+        return np.identity(np.shape(Ps)[-1]) + sinc(angle)*A - self.h(angle)*np.einsum('ijk,ikl->ijl', A, A)
+
+    def actions(self, Ms, Ps):
+        """
+        Stacked matrix-vector multiplication.
+        """
+        return np.einsum('ijk,ik->ij', Ms, Ps)
+
     def random_direction(self, size):
         p = np.random.rand(size)
         p =p/np.linalg.norm(p)
@@ -87,14 +118,11 @@ class Sphere(Geometry):
         """
         (cos(angle)-1)/angle^2
         """
-        # hh = np.zeros_like(angle)
+        angle = np.asanyarray(angle, dtype=float)
+        hh = np.zeros_like(angle)
         idx = np.abs(angle) < 6.0e-4
-        # hh[idx]=-0.5+ 1.0/24*angle[idx]*angle[idx]
-        # hh[~idx] = (np.cos(angle)-1)*angle**(-2)
-        if idx:
-            hh = -0.5+ 1.0/24*angle*angle
-        else:
-            hh = (np.cos(angle)-1)*angle**(-2)
+        hh[idx]=-0.5+ 1.0/24*angle[idx]*angle[idx]
+        hh[~idx] = (np.cos(angle[~idx])-1)*angle[~idx]**(-2)
         return hh
 
     def Adexpinv(self, P1, V1, W2):
@@ -102,7 +130,20 @@ class Sphere(Geometry):
         Symmetric space function (pi_{P1})^{-1} Ad(exp(-V1))(pi W2)
         where pi is the connection.
         """
-        angle = np.linalg.norm(V1)
-        vw = np.inner(V1, W2)
-        pw = np.inner(P1, W2)
+        angle = np.linalg.norm(V1, axis=-1, keepdims=True)
+        vw = np.sum(V1*W2, axis=-1, keepdims=True)
+        pw = np.sum(P1*W2, axis=-1, keepdims=True)
         return W2 -P1*pw + V1*(self.h(angle)* vw-sinc(angle)*pw)
+
+    # the formulae above hold pointwise on stacks of points
+    def exps(self, P1s, V1s):
+        return self.exp(P1s, V1s)
+
+    def logs(self, P1s, P2s):
+        return self.log(P1s, P2s)
+
+    def dexpinvs(self, P1s, V1s, W2s):
+        return self.dexpinv(P1s, V1s, W2s)
+
+    def Adexpinvs(self, P1s, V1s, W2s):
+        return self.Adexpinv(P1s, V1s, W2s)
@@ -1,5 +1,8 @@
 
 class BoundaryCondition(object):
+    # whether the boundary velocity is independent of the other velocities
+    invariant = False
+
     def initialize(self, interpolator):
         self.interpolator = interpolator
 
@@ -30,6 +33,8 @@ class FreeR(Free):
 
 
 class Clamped(BoundaryCondition):
+    invariant = True
+
     def __init__(self, velocity):
         self.boundary_velocity = velocity/3
 
@@ -4,30 +4,20 @@ from .interpolator import Interpolator
 class Exponential(Interpolator):
     def generate_controls(self, points, velocities):
         """
-        Generate movements and control points.
+        Generate movements and control points, as two arrays.
         """
-        for p, v in zip(points, velocities):
-            g = self.geometry.redexp(p, v)
-            control = self.geometry.action(g, p)
-            yield g, control
-
-    def increment(self, velocities):
-        gRs, qRs = list(zip(*self.generate_controls(self.interpolation_points[:-1], velocities[:-1])))
-        gLs, qLs = list(zip(*self.generate_controls(self.interpolation_points[1:], -velocities[1:])))
-        delta = np.zeros_like(velocities[1:-1])
-        gen = zip(
-            self.interpolation_points[1:-1],
-            velocities[1:-1],
-            gLs[:-1],
-            qLs[1:],
-            gRs[1:],
-            qRs[:-1],
-        )
-        for i, (p, v, gL, qL, gR, qR) in enumerate(gen):
-            delta[i] = self.geometry.log(p, self.geometry.action(gL, qL)) - self.geometry.log(p, self.geometry.action(gR, qR)) - 2*v
-        return qRs, qLs, delta/4
-
-
-
-
+        gs = self.geometry.redexps(points, velocities)
+        controls = self.geometry.actions(gs, points)
+        return gs, controls
 
+    def increment(self, P, V, rights, lefts, previous_rights, next_lefts, out):
+        (gRs, _), (gLs, _), (_, previous_qRs), (_, next_qLs) = rights, lefts, previous_rights, next_lefts
+        n = len(P)
+        # the left and right sides are computed in a single call
+        qs = self.geometry.actions(np.concatenate([gLs, gRs]), np.concatenate([next_qLs, previous_qRs]))
+        logs = self.geometry.logs(np.concatenate([P, P]), qs)
+        np.subtract(logs[:n], logs[n:], out=out)
+        out -= V
+        out -= V
+        out /= 4
+        return out
@@ -9,6 +9,27 @@ def cubic_spline(InterpolationClass, interpolation_points, boundaries=(None, Non
     I = InterpolationClass(interpolation_points, make_boundaries(*boundaries), geometry)
     return I.compute_spline()
 
+def split_parity(points):
+    """
+    The points with even and odd indices, as two contiguous arrays.
+    """
+    return [np.ascontiguousarray(points[parity::2]) for parity in (0, 1)]
+
+def merge_parity(evens, odds):
+    """
+    Inverse of `split_parity`.
+    """
+    points = np.zeros((len(evens) + len(odds),) + np.shape(evens)[1:], dtype=evens.dtype)
+    points[0::2] = evens
+    points[1::2] = odds
+    return points
+
+def interior_slice(parity, size):
+    """
+    The interior points among the points of the given parity.
+    """
+    return slice(1 - parity, (size - 2 - parity)//2 + 1)
+
 class Interpolator():
     max_iter = 500
     tolerance = 1e-12
@@ -19,23 +40,101 @@ class Interpolator():
         self.geometry = geometry
         self.size = len(self.interpolation_points)
         [boundary.initialize(self) for boundary in self.boundaries]
+        # red-black ordering: the points are stored by parity,
+        # so that each half-sweep works on contiguous arrays
+        self._points = split_parity(self.interpolation_points)
+        self._interiors = [interior_slice(parity, self.size) for parity in (0, 1)]
+        # buffers for the velocity increments of the interior points, reused at each iteration
+        self._deltas = [np.zeros_like(points[interior]) for points, interior in zip(self._points, self._interiors)]
+        self._abs_deltas = [np.zeros(np.shape(delta)) for delta in self._deltas]
+        # velocities, with the invariant boundary conditions enforced once and for all
+        self._velocities = np.zeros_like(self.interpolation_points)
+        [boundary.enforce(self._velocities) for boundary in self.boundaries if boundary.invariant]
+        self._varying_boundaries = [boundary for boundary in self.boundaries if not boundary.invariant]
         self.postmortem = {}
 
     def compute_controls(self):
         """
         Main fixed point algorithm.
         """
-        velocities = np.zeros_like(self.interpolation_points)
+        velocities = self._velocities
+        velocities[1:-1] = 0.
+        points = self._points
+        parity_velocities = split_parity(velocities)
+        controls = [self.generate_both_controls(P, V) for P, V in zip(points, parity_velocities)]
+        # update the odd interior points, then the even ones
+        parities = [parity for parity in (1, 0) if len(self._deltas[parity])]
         for iter in range(self.max_iter):
-            [boundary.enforce(velocities) for boundary in self.boundaries]
-            qRs, qLs, delta = self.increment(velocities)
-            velocities[1:-1] += delta
-            error = np.max(np.abs(delta))
+            error = 0.
+            if self._varying_boundaries:
+                error = self.enforce_boundaries(velocities, parity_velocities, controls)
+            for parity in parities:
+                interior = self._interiors[parity]
+                # the neighbours of the interior points have the other parity
+                previous = slice(interior.start + parity - 1, interior.stop + parity - 1)
+                following = slice(interior.start + parity, interior.stop + parity)
+                (rights, lefts), (other_rights, other_lefts) = controls[parity], controls[1 - parity]
+                V = parity_velocities[parity][interior]
+                delta = self.increment(
+                    points[parity][interior], V,
+                    tuple(right[interior] for right in rights),
+                    tuple(left[interior] for left in lefts),
+                    tuple(right[previous] for right in other_rights),
+                    tuple(left[following] for left in other_lefts),
+                    out=self._deltas[parity],
+                    )
+                V += delta
+                # only the controls at the points which just moved are recomputed
+                self.update_controls(controls[parity], points[parity], parity_velocities[parity], interior)
+                error = max(error, np.abs(delta, out=self._abs_deltas[parity]).max())
             if error < self.tolerance:
                 break
         self.postmortem['error'] = error
         self.postmortem['iterations'] = iter
-        return qRs, qLs
+        velocities[0::2], velocities[1::2] = parity_velocities
+        qRs, qLs = [merge_parity(*[parity_controls[side][-1] for parity_controls in controls]) for side in (0, 1)]
+        return qRs[:-1], qLs[1:]
+
+    def enforce_boundaries(self, velocities, parity_velocities, controls):
+        """
+        Enforce the varying boundary conditions, and recompute the controls at the boundary points.
+        Return the change in the boundary velocities.
+        """
+        size = self.size
+        for index in (1, size-2):
+            velocities[index] = parity_velocities[index % 2][index // 2]
+        previous = velocities[[0, -1]]
+        [boundary.enforce(velocities) for boundary in self._varying_boundaries]
+        # both boundary points are refreshed in a single call
+        ends = [(index % 2, index // 2) for index in (0, size-1)]
+        for (parity, position), index in zip(ends, (0, -1)):
+            parity_velocities[parity][position] = velocities[index]
+        rights, lefts = self.generate_both_controls(self.interpolation_points[[0, -1]], velocities[[0, -1]])
+        for (parity, position), index in zip(ends, (0, -1)):
+            for side, new_side in zip(controls[parity], (rights, lefts)):
+                for control, new in zip(side, new_side):
+                    control[position] = new[index]
+        return np.abs(velocities[[0, -1]] - previous).max()
+
+    def generate_both_controls(self, points, velocities):
+        """
+        The right and left controls at the given points.
+        Both sides are computed in a single call.
+        """
+        n = len(points)
+        both = self.generate_controls(np.concatenate([points, points]), np.concatenate([velocities, -velocities]))
+        rights = tuple(control[:n] for control in both)
+        lefts = tuple(control[n:] for control in both)
+        return rights, lefts
+
+    def update_controls(self, controls, points, velocities, selection):
+        """
+        Recompute in place the right and left controls at the selected points.
+        """
+        new_controls = self.generate_both_controls(points[selection], velocities[selection])
+        for side, new_side in zip(controls, new_controls):
+            for control, new in zip(side, new_side):
+                control[selection] = new
 
     def compute_spline_control_points(self, qRs, qLs):
         """
@@ -64,5 +163,17 @@ class Interpolator():
                        knots=self.get_knots(),
                        geometry=self.geometry)
 
-    def increment(self, velocities):
+    def generate_controls(self, points, velocities):
+        """
+        Controls at the given points with the given velocities, as a tuple of arrays.
+        The last array contains the control points.
+        """
+        raise NotImplementedError()
+
+    def increment(self, P, V, rights, lefts, previous_rights, next_lefts, out):
+        """
+        Compute in `out` the velocity increments at the interior points P with velocities V,
+        from their right and left controls, the right controls of the previous points
+        and the left controls of the next points.
+        """
         raise NotImplementedError()
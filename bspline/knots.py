@@ -50,18 +50,26 @@ n+2      n-1       2
 
     ktol = 1e-13
 
+    @property
+    def interior(self):
+        """
+        The knots delimiting the curves.
+        """
+        return self.knots[self.degree-1:-self.degree+1]
+
     def left_knot(self, t):
         """
         Find out between which node a time t is.
+        The time t may also be an array of times.
         """
-        diff = self.knots[self.degree-1:-self.degree+1] - t
-        isrightof = diff > self.ktol
-        if np.all(isrightof):
+        interior = self.interior
+        # number of interior knots left of t, up to the tolerance
+        nb_left = np.searchsorted(interior, np.add(t, self.ktol), side='right')
+        if np.any(nb_left == 0):
             raise ValueError("Time too small")
-        if np.all(~isrightof):
+        if np.any(nb_left == len(interior)):
             raise ValueError("Time too big")
-        left = np.argmax(isrightof) - 1 # argmax gives the right knot...
-        return left + self.degree-1
+        return nb_left - 1 + self.degree-1
 
     def abscissae(self):
         """
@@ -70,8 +78,9 @@ n+2      n-1       2
         if self.degree == 0:
             k = np.hstack([-1, self.knots])
             return k
-        kernel = np.ones(self.degree)/self.degree
-        res = np.convolve(kernel, self.knots, 'valid')
+        # moving average of `degree` consecutive knots, from the cumulative sums
+        sums = np.cumsum(np.hstack([0., self.knots]))
+        res = (sums[self.degree:] - sums[:-self.degree])/self.degree
         return res
 
     def knot_range(self):
@@ -20,8 +20,10 @@ control_style={
         }
 
 def plot_knots(spline, style=knot_style, coordinates=(0,1)):
-    pts = [s(s.interval[i]) for i in [0,1] for s in spline]
-    apts = np.array(pts)
+    times = np.array([s.interval[i] for i in [0,1] for s in spline])
+    # each end is evaluated with its own spline, which matters for discontinuous knots
+    index = np.tile(np.arange(len(spline)), 2)
+    apts = np.reshape(spline._evaluate(times, index), (len(times), -1))
     plt.plot(apts[:,coordinates[0]],apts[:,coordinates[1]], **style)
 
 
@@ -37,11 +39,15 @@ def plot(spline, with_knots=False, with_control_points=True, plotres=200, coordi
     """
     if with_control_points:
         plot_control_points(spline)
-    for s in spline:
-        left, right = s.interval
-        ts = np.linspace(left, right, plotres)
-        val = s(ts)
-        plt.plot(val[:,coordinates[0]],val[:,coordinates[1]], label="{:1.0f} - {:1.0f}".format(left, right), lw=2)
+    times = np.array([np.linspace(s.interval[0], s.interval[1], plotres) for s in spline]) # (C, T)
+    # each curve is evaluated with its own spline, which matters for discontinuous knots
+    index = np.repeat(np.arange(len(times)), plotres)
+    vals = np.reshape(spline._evaluate(times.ravel(), index), times.shape + (-1,)) # (C, T, D)
+    # one line for all the curves, separated by NaN
+    gaps = np.full((len(times), 1), np.nan)
+    xs = np.hstack([vals[:,:,coordinates[0]], gaps]).ravel()
+    ys = np.hstack([vals[:,:,coordinates[1]], gaps]).ravel()
+    plt.plot(xs, ys, lw=2)
     if with_knots:
         plot_knots(spline, coordinates=coordinates)
 
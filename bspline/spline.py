@@ -13,6 +13,72 @@ def get_bezier_knots(degree):
     knots[degree:] = 1
     return knots
 
+def is_bezier(knots, degree):
+    """
+    Whether the first and the last `degree` knots are equal, in which case the spline is a Bézier curve.
+    The interval must not be empty, since the Bernstein form divides by its length.
+    """
+    return degree > 0 and knots[-1] > knots[0] and np.all(knots[:degree] == knots[0]) and np.all(knots[degree:] == knots[-1])
+
+def get_bernstein_weights(degree, u):
+    """
+    Bernstein polynomials of the given degree at the normalised times u.
+    """
+    binomials = [1]
+    for i in range(1, degree+1):
+        binomials.append(binomials[-1]*(degree-i+1)//i)
+    i = np.reshape(np.arange(degree+1), (-1,) + (1,)*np.ndim(u))
+    return np.reshape(binomials, np.shape(i))*u**i*(1-u)**(degree-i) # (K,T)
+
+def get_level_diffs(knots, degree):
+    """
+    Knot differences kns[n:] - kns[:-n] at each level of the de Boor algorithm.
+    """
+    knots = np.asarray(knots, dtype=float)
+    level_diffs = []
+    for i in range(degree):
+        diffs = knots[degree:len(knots)-i] - knots[i:degree]
+        # trick to handle cases of equal knots (the knots are sorted, so diffs >= 0):
+        np.maximum(diffs, np.finfo(knots.dtype).eps, out=diffs)
+        level_diffs.append(diffs)
+    return level_diffs
+
+def get_coeff_slice(data_dim):
+    """
+    reshape the coefficients using data dimension and possible time shape
+    for vectorial data, this amounts to the slice (:, np.newaxis,...)
+    """
+    return (slice(None),) + (np.newaxis,)*data_dim + (Ellipsis,)
+
+def get_basis_weights(rcoeffs):
+    """
+    Weights of the control points in the flat de Boor algorithm, given the coefficients at each level.
+    They are obtained by running the recursion backwards, on scalars only.
+    """
+    weights = np.ones_like(rcoeffs[-1]) # (1,T)
+    for rcoeff in reversed(rcoeffs):
+        previous = np.zeros((len(rcoeff)+1,) + np.shape(rcoeff)[1:])
+        previous[:-1] = weights*(1-rcoeff)
+        previous[1:] += weights*rcoeff
+        weights = previous
+    return weights # (K,T)
+
+def get_rcoeffs(offsets, level_diffs):
+    """
+    Coefficients of each level of the de Boor algorithm, from the time offsets from the left knots
+    and the knot differences at each level.
+    """
+    return [offsets[i:]/diffs for i, diffs in enumerate(level_diffs)] # (K,T)
+
+def deboor(geometry, pts, rcoeffs, coeff_slice):
+    """
+    de Boor algorithm with the given coefficients at each level.
+    The time is on the last index of all the arrays.
+    """
+    for rcoeff in rcoeffs:
+        pts = geometry.geodesic(pts[:-1], pts[1:], rcoeff[coeff_slice]) # (K, D, 1), (K, 1, T)
+    return pts[0] # (D, T)
+
 class Spline(object):
     def __init__(self, control_points, knots=None, geometry=Flat()):
         self.control_points = np.array(control_points)
@@ -25,42 +91,51 @@ class Spline(object):
 
         self.interval = knots[self.degree-1], knots[self.degree]
 
+        self._level_diffs = get_level_diffs(self.knots, self.degree)
+        self._is_bezier = is_bezier(self.knots, self.degree)
+
         self.geometry = geometry
 
+        # control points with the data dimensions flattened, for the linear combinations of flat geometry
+        self._flat_points = np.reshape(self.control_points, (len(self.control_points), -1)) # (K, D)
+
     @property
     def coeff_slice(self):
         """
         reshape the coefficients using data dimension and possible time shape
         for vectorial data, this amounts to the slice (:, np.newaxis,...)
         """
-        return (slice(None),) + (np.newaxis,)*self.data_dim + (Ellipsis,)
-
-    def iterate(self, t, pts, kns):
-        n = len(kns)//2
-        diffs = kns[n:] - kns[:-n] # (K,1)
-        # trick to handle cases of equal knots:
-        diffs[diffs==0.] = np.finfo(kns.dtype).eps
-        rcoeff = (t - kns[:-n])/diffs # (K,T)
-        pts = self.geometry.geodesic(pts[:-1], pts[1:], rcoeff[self.coeff_slice]) # (K, D, 1), (K, 1, T)
-        kns = kns[1:-1]
-        return pts, kns
-
-    def __call__(self, t):
-        t = np.array(t)
-        kns = self.knots
-        pts = self.control_points
+        return get_coeff_slice(self.data_dim)
 
+    def get_rcoeffs(self, t):
+        """
+        Coefficients of each level of the de Boor algorithm, with the time on the last index.
+        """
         time_shape = (1,)*len(np.shape(t)) # time shape to add for broadcasting
-        # we put the time on the last index
         kns = np.reshape(self.knots, self.knots.shape + time_shape) # (K, 1)
-        pts = np.reshape(self.control_points, self.control_points.shape + time_shape) # (K, D, 1)
+        # the left knots of every level are kns[i:degree], so the time offsets are computed once for all levels
+        offsets = t - kns[:self.degree] # (degree, T)
+        level_diffs = [np.reshape(diffs, diffs.shape + time_shape) for diffs in self._level_diffs]
+        return get_rcoeffs(offsets, level_diffs)
 
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
 
-        degree = len(kns) - len(pts) + 1
-        for i in range(degree):
-            pts, kns = self.iterate(t, pts, kns)
+        if self.degree > 0 and self.geometry.linear:
+            # the combination is linear: compute the weights of the control points, then combine the flattened points once
+            if self._is_bezier:
+                # closed form in the Bernstein basis
+                left, right = self.interval
+                weights = get_bernstein_weights(self.degree, (t - left)/(right - left))
+            else:
+                weights = get_basis_weights(self.get_rcoeffs(t))
+            result = np.tensordot(weights, self._flat_points, axes=(0, 0)) # (T, D)
+            return np.reshape(result, np.shape(t) + np.shape(self.control_points)[1:])
 
-        result = pts[0] # (D, T)
+        time_shape = (1,)*len(np.shape(t)) # time shape to add for broadcasting
+        # we put the time on the last index
+        pts = np.reshape(self.control_points, self.control_points.shape + time_shape) # (K, D, 1)
+        result = deboor(self.geometry, pts, self.get_rcoeffs(t), self.coeff_slice) # (D, T)
         # put time first by permuting the indices; in the vector case, this is a standard permutation
         permutation = len(np.shape(t))*(self.data_dim,) + tuple(range(self.data_dim))
         return result.transpose(permutation) # (T, D)
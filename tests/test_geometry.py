@@ -67,3 +67,98 @@ def test_on_manifold(geo):
     for size in geo['sizes']:
         p, v = geo['geometry'].random_direction(size)
         npt.assert_allclose(*geo['geometry'].on_manifold(np.array([p])), atol=1e-13)
+
+def get_stacked_data(geo, P, V, W):
+    """
+    Stacks of points P, velocities V, vectors W, points Q = exp(P, V) and movements M = redexp(P, V).
+    """
+    Q = np.array([geo.exp(p, v) for p, v in zip(P, V)])
+    M = np.array([geo.redexp(p, v) for p, v in zip(P, V)])
+    return {'geometry': geo, 'P': P, 'V': V, 'W': W, 'Q': Q, 'M': M}
+
+def random_stack(N=5, size=3, dtype=float):
+    stack = np.random.randn(N, size)
+    if dtype == complex:
+        stack = stack + 1j*np.random.randn(N, size)
+    return stack
+
+def get_sphere_stack(N=5, size=3, dtype=float):
+    """
+    Random points on the sphere, and horizontal velocities.
+    """
+    P = random_stack(N, size, dtype)
+    P /= np.linalg.norm(P, axis=1)[:, np.newaxis]
+    V = random_stack(N, size, dtype)
+    V -= np.sum(P.conj()*V, axis=1)[:, np.newaxis]*P
+    V /= 2*np.linalg.norm(V, axis=1)[:, np.newaxis]
+    return P, V
+
+np.random.seed(0)
+stacked_data = [
+    get_stacked_data(geometry.Flat(), random_stack(), random_stack(), random_stack()),
+    get_stacked_data(geometry.Sphere(), *get_sphere_stack() + (random_stack(),)),
+    get_stacked_data(geometry.Sphere(), *get_sphere_stack(dtype=complex) + (random_stack(dtype=complex),)),
+    get_stacked_data(geometry.Projective(), *get_sphere_stack(dtype=complex) + (random_stack(dtype=complex),)),
+]
+
+# stacked method: (single point method, arguments)
+stacked_methods = {
+    'exps': ('exp', ('P', 'V')),
+    'logs': ('log', ('P', 'Q')),
+    'dexpinvs': ('dexpinv', ('P', 'V', 'W')),
+    'Adexpinvs': ('Adexpinv', ('P', 'V', 'W')),
+    'redexps': ('redexp', ('P', 'V')),
+    'actions': ('action', ('M', 'P')),
+}
+
+def stacked_id(stacked):
+    name = type(stacked['geometry']).__name__
+    if np.iscomplexobj(stacked['P']):
+        name += '-complex'
+    return name
+
+@pytest.mark.parametrize('stacked', stacked_data, ids=stacked_id)
+@pytest.mark.parametrize('method', sorted(stacked_methods))
+def test_stacked(stacked, method):
+    """
+    Stacked methods coincide with looping over the single point methods.
+    """
+    geo = stacked['geometry']
+    single, keys = stacked_methods[method]
+    args = [stacked[key] for key in keys]
+    expected = np.array([getattr(geo, single)(*point_args) for point_args in zip(*args)])
+    npt.assert_allclose(getattr(geo, method)(*args), expected, atol=1e-14)
+
+redexp_data = [
+    (geometry.Flat(), lambda size: (np.random.randn(size), np.random.randn(size))),
+    (geometry.Sphere(), geometry.Sphere().random_direction),
+    (geometry.Hyperbolic(), geometry.Hyperbolic().random_direction),
+]
+
+@pytest.mark.parametrize('geo, direction', redexp_data, ids=lambda d: type(d).__name__)
+@pytest.mark.parametrize('scale', [1., 1e-6, 0.])
+def test_redexp(geo, direction, scale):
+    """
+    The closed form reduced exponential coincides with the exponential of the connection.
+    """
+    np.random.seed(0)
+    p, v = direction(4)
+    v = scale*v
+    npt.assert_allclose(geo.redexp(p, v), geometry.exponential(geo.connection(p, v)), atol=1e-14)
+
+def test_sphere_h():
+    """
+    h accepts Python floats as well as arrays.
+    """
+    npt.assert_allclose(geometry.Sphere().h(.3), (np.cos(.3)-1)/.3**2)
+    npt.assert_allclose(geometry.Sphere().h(np.array([.3, 1e-4])), [(np.cos(.3)-1)/.3**2, -.5 + 1e-8/24])
+
+def test_hyperbolic_h():
+    """
+    Both branches of h agree with the series of (cosh(arg)-1)/arg^2 around the threshold.
+    """
+    args = np.array([1e-3, 7e-4, 5e-4, 1e-4])
+    expected = .5 + args**2/24 + args**4/720
+    npt.assert_allclose(geometry.Hyperbolic().h(args), expected, rtol=1e-8)
+    npt.assert_allclose(geometry.Hyperbolic().h(np.array([0.])), .5)
+    npt.assert_allclose(geometry.Hyperbolic().h(.3), (np.cosh(.3)-1)/.3**2)
@@ -121,3 +121,14 @@ def test_on_manifold(interpolator, N=40):
     npt.assert_allclose(*interpolator['geometry'].on_manifold(pts), atol=1e-13)
 
 
+
+@pytest.mark.parametrize('cls', [Riemann, Exponential])
+def test_two_points(cls):
+    """
+    With no interior points, the free boundary velocities are still iterated to a fixed point.
+    """
+    I = cls(np.array([[0.,0],[3,0]]), make_boundaries(None, None), geometry=geometry.Flat())
+    qRs, qLs = I.compute_controls()
+    npt.assert_allclose(qRs, [[1.,0]])
+    npt.assert_allclose(qLs, [[2.,0]])
+    assert I.postmortem['error'] < I.tolerance
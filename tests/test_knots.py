@@ -58,6 +58,16 @@ def test_left_knot(long_knots):
     with pytest.raises(ValueError):
         knots.left_knot(5.5)
 
+def test_left_knot_array(long_knots):
+    knots = long_knots
+    npt.assert_array_equal(knots.interior, [3., 4., 5.])
+    ts = np.array([3.8, 3.2, 4.8, 4.0, 4.0-1e-14])
+    npt.assert_array_equal(knots.left_knot(ts), [2, 2, 3, 3, 3])
+    with pytest.raises(ValueError):
+        knots.left_knot(np.array([3.5, 2.5]))
+    with pytest.raises(ValueError):
+        knots.left_knot(np.array([3.5, 5.5]))
+
 def test_knot_range(long_knots):
     knots = long_knots
     k = Knots(np.arange(10))
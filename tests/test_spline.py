@@ -64,6 +64,14 @@ class TestBezier():
     def test_create_bezier(self):
         b_ = BSpline(self.controls)
 
+    def test_empty_interval(self):
+        """
+        Equal knots do not give a Bézier curve on an empty interval.
+        """
+        s = Spline(np.array([[1.,1],[0,-1],[-1,1],[2,0]]), knots=np.ones(6))
+        assert not s._is_bezier
+        assert np.all(np.isfinite(s(1.)))
+
 
 class TestDoubleQuadSpline():
     def setup_method(self, method):
@@ -97,6 +105,15 @@ class Test_BSpline():
         with self.assertRaises(ValueError):
             self.b(3.5, lknot=4)
 
+    def test_unsorted_times(self):
+        """
+        The values follow the order of the times, even across intervals.
+        """
+        ts = np.linspace(3., 5., 11)
+        perm = np.random.RandomState(0).permutation(len(ts))
+        npt.assert_allclose(self.b(ts[perm])[np.argsort(perm)], self.b(ts))
+        npt.assert_allclose(self.b(ts[perm]), [self.b(t) for t in ts[perm]])
+
     @pytest.mark.skip("fix later")
     def test_vectorize(self):
         control_points = np.array([0.,1.]*2)
@@ -130,6 +147,56 @@ class Test_BSpline3():
         assert np.shape(self.b(3.5)) == (3,)
 
 
+class SquaredFlat(geometry.Flat):
+    """
+    Flat geometry with the geodesics reparametrised by theta**2.
+    """
+    linear = False
+
+    def geodesic(self, P1, P2, theta):
+        return super(SquaredFlat, self).geodesic(P1, P2, theta**2)
+
+def test_nonlinear_subclass():
+    """
+    A Flat subclass overriding the geodesic is evaluated with its own geodesic.
+    """
+    controls = np.array([[1.,1],[0,-1],[-1,1]])
+    geo = SquaredFlat()
+    t = .3
+    expected = geo.geodesic(geo.geodesic(controls[0], controls[1], t), geo.geodesic(controls[1], controls[2], t), t)
+    npt.assert_allclose(Spline(controls, geometry=geo)(t), expected)
+    npt.assert_allclose(BSpline(controls, geometry=geo)(t), expected)
+
+
+class TestDiscontinuousKnots():
+    def setup_method(self, method):
+        controls = np.array([[-1.,1],[0,-1],[2.,3],[3,1],[1,0],[0,2]])
+        self.b = BSpline(controls, knots=np.array([0.,0,1,1,1,2,2]))
+
+    def test_evaluate(self):
+        """
+        Each spline is evaluated up to its own right end.
+        """
+        for i, s in enumerate(self.b):
+            ts = np.linspace(s.interval[0], s.interval[1], 10)
+            npt.assert_allclose(self.b._evaluate(ts, np.full(len(ts), i)), s(ts))
+
+    def test_plot(self):
+        """
+        The plotted curves end at their own left limit.
+        """
+        import matplotlib.pyplot as plt
+        plt.figure()
+        plotting.plot(self.b, with_control_points=False, with_knots=True, plotres=10)
+        curves, knots = plt.gca().get_lines()
+        xys = np.reshape(curves.get_xydata(), (len(self.b), 11, 2))
+        for s, xy in zip(self.b, xys):
+            npt.assert_allclose(xy[:-1], s(np.linspace(s.interval[0], s.interval[1], 10)))
+        ends = np.array([s(s.interval[i]) for i in [0,1] for s in self.b])
+        npt.assert_allclose(knots.get_xydata(), ends)
+        plt.close()
+
+
 import os
 
 @pytest.mark.skip("Testing the demo notebook")